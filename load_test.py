@@ -0,0 +1,704 @@
+"""Load-test harness for meeting_room.py.
+
+Drives many concurrent headless sessions of the app through Streamlit's
+AppTest. Every session runs in its own process (AppTest swaps st.secrets and
+the Streamlit runtime globally, so sessions cannot share a process) and talks
+to one shared in-memory worksheet. smtplib.SMTP is patched inside each
+session process, so no SMTP server runs and no SMTP protocol or socket cost
+is measured; --smtp-latency only adds a sleep per connection. Nothing
+reaches Google Sheets or Gmail.
+
+    python load_test.py --sessions 20 --actions 10
+    python load_test.py --sessions 40 --mix book=0.6,cancel=0.1,view=0.3 --json run.json
+
+Reports throughput, p50/p95/p99 rerun latency, Sheets and SMTP calls per
+action, and double-booking violations found in the worksheet afterwards.
+"""
+import argparse
+import collections
+import concurrent.futures
+import contextlib
+import copy
+import datetime
+import json
+import logging
+import multiprocessing
+import random
+import re
+import threading
+import time
+from datetime import timedelta
+from multiprocessing.managers import SyncManager
+from pathlib import Path
+from unittest import mock
+
+import pytz
+
+APP_PATH = Path(__file__).with_name("meeting_room.py")
+IST = pytz.timezone('Asia/Kolkata')
+
+HEADERS = [
+    "booking_id", "date", "start_time", "end_time", "room",
+    "name", "email", "description", "cc_emails", "created_at"
+]
+
+# Kept in sync with ROOM_CAPACITY in meeting_room.py; only used for seeding.
+ROOMS = [
+    "HIMALAYA - Basement",
+    "NEELGIRI - Ground Floor",
+    "ARAVALI  - Ground Floor",
+    "KAILASH - 1 Floor",
+    "ANNAPURNA - 1 Floor",
+    "EVEREST  - 2 Floor",
+    "KANANACJUNGA - 2 Floor",
+    "SHIVALIK - 3 Floor",
+    "TRISHUL - 3 Floor",
+    "DHAULAGIRI - 3 Floor",
+]
+
+# Booked meetings start inside --start-window (end exclusive) and last one of
+# these lengths. Narrow the window, e.g. 09:00-10:00, to pile bookings onto
+# the same slots.
+DEFAULT_START_WINDOW = "09:00-18:00"
+MEETING_MINUTES = [15, 30, 45, 60]
+
+ACTIONS = ["book", "cancel", "view"]
+DEFAULT_MIX = "book=0.35,cancel=0.15,view=0.5"
+
+SHEETS_CALLS = ["authorize", "open", "worksheet", "get_all_records", "append_row", "find"]
+SMTP_CALLS = ["connect", "login", "sendmail"]
+
+FAKE_SECRETS = {
+    "gsheets": {
+        "type": "service_account",
+        "project_id": "load-test",
+        "private_key_id": "load-test",
+        "private_key": "load-test",
+        "client_email": "load-test@example.com",
+        "client_id": "load-test",
+        "auth_uri": "https://example.com/auth",
+        "token_uri": "https://example.com/token",
+        "auth_provider_x509_cert_url": "https://example.com/certs",
+        "client_x509_cert_url": "https://example.com/cert",
+    },
+    "email": {
+        "sender_email": "load-test@example.com",
+        "sender_password": "load-test",
+    },
+}
+
+
+# --- Shared Worksheet ---
+class SheetStore:
+    """Rows of the Bookings worksheet, served to every session process."""
+
+    def __init__(self, rows=None):
+        self._lock = threading.Lock()
+        self._rows = [list(HEADERS)] + [list(row) for row in rows or []]
+
+    def get_all_records(self):
+        with self._lock:
+            header = self._rows[0]
+            return [dict(zip(header, row)) for row in self._rows[1:]]
+
+    def append_row(self, row):
+        with self._lock:
+            self._rows.append(list(row))
+
+    def find(self, query):
+        with self._lock:
+            for row_number, row in enumerate(self._rows, start=1):
+                for col_number, value in enumerate(row, start=1):
+                    if str(value) == query:
+                        return row_number, col_number
+        return None
+
+    def rows(self):
+        with self._lock:
+            return [list(row) for row in self._rows[1:]]
+
+
+class HarnessManager(SyncManager):
+    pass
+
+
+HarnessManager.register("SheetStore", SheetStore)
+
+
+# --- Fakes used inside a session process ---
+class FakeCell:
+    def __init__(self, row, col, value):
+        self.row = row
+        self.col = col
+        self.value = value
+
+
+class FakeWorksheet:
+    def __init__(self, store, calls, latency):
+        self.store = store
+        self.calls = calls
+        self.latency = latency
+
+    def _call(self, name):
+        self.calls["sheets." + name] += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def get_all_records(self):
+        self._call("get_all_records")
+        return self.store.get_all_records()
+
+    def append_row(self, row):
+        self._call("append_row")
+        self.store.append_row(row)
+
+    def find(self, query):
+        self._call("find")
+        found = self.store.find(query)
+        if found is None:
+            return None
+        return FakeCell(found[0], found[1], query)
+
+
+class FakeSpreadsheet:
+    def __init__(self, worksheet):
+        self._worksheet = worksheet
+
+    def worksheet(self, title):
+        self._worksheet._call("worksheet")
+        return self._worksheet
+
+
+class FakeClient:
+    def __init__(self, worksheet):
+        self._worksheet = worksheet
+
+    def open(self, title):
+        self._worksheet._call("open")
+        return FakeSpreadsheet(self._worksheet)
+
+
+def make_fake_smtp(calls, latency):
+    class FakeSMTP:
+        def __init__(self, host="", port=0, *args, **kwargs):
+            calls["smtp.connect"] += 1
+            if latency:
+                time.sleep(latency)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            return False
+
+        def starttls(self, *args, **kwargs):
+            pass
+
+        def login(self, user, password):
+            calls["smtp.login"] += 1
+
+        def sendmail(self, from_addr, to_addrs, msg, *args, **kwargs):
+            calls["smtp.sendmail"] += 1
+            return {}
+
+        def quit(self):
+            pass
+
+    return FakeSMTP
+
+
+# --- Session Flows ---
+class SelectionLost(Exception):
+    """A widget the user was working with disappeared between reruns."""
+
+
+def find_widget(widgets, label):
+    for widget in widgets:
+        if widget.label == label:
+            return widget
+    return None
+
+
+def require_widget(widgets, label):
+    # Another session's booking changes the option lists, which makes
+    # Streamlit reset the selectbox and hide everything rendered below it.
+    widget = find_widget(widgets, label)
+    if widget is None:
+        raise SelectionLost(label)
+    return widget
+
+
+def timed_run(at, widget, latencies, timeout):
+    started = time.perf_counter()
+    if widget is None:
+        at.run(timeout=timeout)
+    else:
+        widget.run(timeout=timeout)
+    latencies.append(time.perf_counter() - started)
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+
+
+def think(rng, think_time):
+    if think_time:
+        time.sleep(rng.expovariate(1 / think_time))
+
+
+def book_flow(at, rng, session, store, options, latencies):
+    timeout = options["timeout"]
+    timed_run(at, None, latencies, timeout)
+    today = datetime.datetime.now(IST).date()
+    date = today + timedelta(days=rng.randint(1, options["days"]))
+
+    think(rng, options["think_time"])
+    timed_run(at, require_widget(at.date_input, "Select Date:").set_value(date), latencies, timeout)
+
+    think(rng, options["think_time"])
+    start_widget = require_widget(at.selectbox, "Start Time:")
+    window_start, window_end = options["start_window"]
+    start_slots = [option for option in start_widget.options if window_start <= option < window_end]
+    if not start_slots:
+        raise RuntimeError(f"No start times from {window_start} to before {window_end}")
+    start_time = rng.choice(start_slots)
+    timed_run(at, start_widget.select_index(start_widget.options.index(start_time)), latencies, timeout)
+
+    think(rng, options["think_time"])
+    end_widget = require_widget(at.selectbox, "End Time:")
+    start = datetime.datetime.strptime(start_time, '%H:%M:%S')
+    wanted = {(start + timedelta(minutes=minutes)).strftime('%H:%M:%S') for minutes in MEETING_MINUTES}
+    end_slots = [option for option in end_widget.options if option in wanted]
+    if not end_slots:
+        raise RuntimeError(f"No end times {MEETING_MINUTES} minutes after {start_time}")
+    end_time = rng.choice(end_slots)
+    timed_run(at, end_widget.select_index(end_widget.options.index(end_time)), latencies, timeout)
+
+    room_widget = find_widget(at.selectbox, "Select Room:")
+    if room_widget is None:
+        return "no_room"
+    think(rng, options["think_time"])
+    timed_run(at, room_widget.select_index(rng.randrange(len(room_widget.options))), latencies, timeout)
+
+    think(rng, options["think_time"])
+    require_widget(at.text_input, "Meeting Title:").set_value(f"Load test {session['index']}")
+    require_widget(at.text_input, "Your Name:").set_value(f"User {session['index']}")
+    require_widget(at.text_input, "Your Email:").set_value(session["email"])
+    timed_run(at, None, latencies, timeout)
+
+    think(rng, options["think_time"])
+    timed_run(at, require_widget(at.button, "Confirm Booking").click(), latencies, timeout)
+    for message in at.success:
+        match = re.search(r"Booking confirmed! ID: (\d+)", message.value)
+        if match:
+            session["bookings"].append(int(match.group(1)))
+            if any("Email could not be sent." in warning.value for warning in at.warning):
+                return "booked_no_email"
+            return "booked"
+    if require_widget(at.selectbox, "Select Room:").value is None:
+        raise SelectionLost("Select Room:")
+    return "not_booked"
+
+
+def cancel_flow(at, rng, session, store, options, latencies):
+    timeout = options["timeout"]
+    timed_run(at, None, latencies, timeout)
+
+    think(rng, options["think_time"])
+    timed_run(at, require_widget(at.sidebar.selectbox, "Menu").set_value("Cancel Booking"), latencies, timeout)
+    if not session["bookings"]:
+        return "nothing_to_cancel"
+
+    # The ID is only forgotten once its row is really gone from the sheet.
+    booking_id = rng.choice(session["bookings"])
+    reservation_widget = find_widget(at.selectbox, "Upcoming Bookings")
+    if reservation_widget is None:
+        return "not_listed"
+    choices = [option for option in reservation_widget.options if option.startswith(f"ID: {booking_id} - ")]
+    if not choices:
+        return "not_listed"
+
+    think(rng, options["think_time"])
+    timed_run(at, reservation_widget.set_value(choices[0]), latencies, timeout)
+
+    think(rng, options["think_time"])
+    email_widget = require_widget(at.text_input, "Enter your registered email to confirm cancellation:")
+    timed_run(at, email_widget.set_value(session["email"]), latencies, timeout)
+
+    think(rng, options["think_time"])
+    timed_run(at, require_widget(at.button, "Cancel Booking").click(), latencies, timeout)
+    if any("Booking cancelled successfully." in message.value for message in at.success):
+        # The app reports success even though remove_booking_from_sheet()
+        # never deletes the row, so check the shared sheet itself.
+        if store.find(str(booking_id)) is not None:
+            return "cancelled_not_removed"
+        session["bookings"].remove(booking_id)
+        if any("email could not be sent." in warning.value for warning in at.warning):
+            return "cancelled_no_email"
+        return "cancelled"
+    if require_widget(at.selectbox, "Upcoming Bookings").value is None:
+        raise SelectionLost("Upcoming Bookings")
+    return "not_cancelled"
+
+
+def view_flow(at, rng, session, store, options, latencies):
+    timeout = options["timeout"]
+    timed_run(at, None, latencies, timeout)
+
+    think(rng, options["think_time"])
+    timed_run(at, require_widget(at.sidebar.selectbox, "Menu").set_value("View Bookings"), latencies, timeout)
+    return "viewed"
+
+
+FLOWS = {
+    "book": book_flow,
+    "cancel": cancel_flow,
+    "view": view_flow,
+}
+
+
+def run_session(index, store, barrier, options):
+    """Replay one simulated user's actions; runs in its own process."""
+    with contextlib.ExitStack() as patches:
+        try:
+            # Imported here so the parent process never loads Streamlit.
+            import gspread
+            import smtplib
+            from oauth2client.service_account import ServiceAccountCredentials
+            from streamlit.testing.v1 import AppTest
+
+            # AppTest builds session state outside a script thread, which logs a
+            # harmless "missing ScriptRunContext" warning for every page load.
+            logging.getLogger("streamlit.runtime.scriptrunner_utils.script_run_context").disabled = True
+
+            calls = collections.Counter()
+            worksheet = FakeWorksheet(store, calls, options["sheets_latency"])
+
+            def authorize(creds):
+                worksheet._call("authorize")
+                return FakeClient(worksheet)
+
+            patches.enter_context(mock.patch.object(ServiceAccountCredentials, "from_json_keyfile_dict", mock.Mock()))
+            patches.enter_context(mock.patch.object(gspread, "authorize", authorize))
+            patches.enter_context(mock.patch.object(smtplib, "SMTP", make_fake_smtp(calls, options["smtp_latency"])))
+        except BaseException:
+            # Break the barrier so the run stops now instead of waiting out its timeout.
+            barrier.abort()
+            raise
+        barrier.wait()
+        return replay_session(index, store, calls, AppTest, options)
+
+
+def replay_session(index, store, calls, app_test, options):
+    rng = random.Random(f"{options['seed']}-{index}")
+    session = {
+        "index": index,
+        "email": f"user{index}@example.com",
+        "bookings": [],
+    }
+    records = []
+    for _ in range(options["actions"]):
+        action = rng.choices(ACTIONS, weights=[options["mix"][name] for name in ACTIONS])[0]
+        # Every action is a fresh page load, like a user opening the app.
+        at = app_test.from_file(str(APP_PATH), default_timeout=options["timeout"])
+        at.secrets = copy.deepcopy(FAKE_SECRETS)
+        calls.clear()
+        latencies = []
+        error = None
+        try:
+            outcome = FLOWS[action](at, rng, session, store, options, latencies)
+        except SelectionLost:
+            outcome = "selection_lost"
+        except Exception as e:
+            outcome = "error"
+            error = f"{type(e).__name__}: {e}"
+        # st.error() text explains outcomes like booked_no_email, e.g. why
+        # no sendmail call was made.
+        app_errors = [element.value for element in at.error] if latencies else []
+        records.append({
+            "session": index,
+            "action": action,
+            "outcome": outcome,
+            "error": error,
+            "app_errors": app_errors,
+            "rerun_latencies": latencies,
+            "calls": dict(calls),
+        })
+        think(rng, options["think_time"])
+    return records
+
+
+# --- Seeding and Checks ---
+def overlaps(start_time, end_time, b_start_time, b_end_time):
+    # Same string comparison as is_room_available() in meeting_room.py.
+    return not (end_time <= b_start_time or start_time >= b_end_time)
+
+
+def seed_rows(count, days, rng):
+    today = datetime.datetime.now(IST).date()
+    created_at = datetime.datetime.now(IST).strftime("%y-%m-%d %H:%M:%S")
+    taken = collections.defaultdict(list)
+    # Unique IDs: the app keys bookings by ID and find() returns the first match.
+    booking_ids = rng.sample(range(1000, 10000), min(count, 9000))
+    rows = []
+    attempts = 0
+    while len(rows) < len(booking_ids) and attempts < count * 20:
+        attempts += 1
+        date = str(today + timedelta(days=rng.randint(-30, days)))
+        room = rng.choice(ROOMS)
+        start = datetime.datetime.combine(today, datetime.time(8, 0)) + timedelta(minutes=15 * rng.randint(0, 44))
+        end = start + timedelta(minutes=15 * rng.randint(1, 8))
+        start_time, end_time = start.strftime('%H:%M:%S'), end.strftime('%H:%M:%S')
+        if any(overlaps(start_time, end_time, b_start, b_end) for b_start, b_end in taken[(date, room)]):
+            continue
+        taken[(date, room)].append((start_time, end_time))
+        rows.append([
+            booking_ids[len(rows)], date, start_time, end_time, room,
+            "Seed User", "seed@example.com", "Seeded meeting", "", created_at,
+        ])
+    if len(rows) < count:
+        # A smaller sheet is a less contended one, so don't quietly measure that instead.
+        raise ValueError(
+            f"Could only seed {len(rows)} of {count} bookings without overlaps or duplicate IDs; "
+            "lower --seed-bookings or raise --days."
+        )
+    return rows
+
+
+def find_double_bookings(rows):
+    by_slot = collections.defaultdict(list)
+    for row in rows:
+        record = dict(zip(HEADERS, row))
+        by_slot[(record["date"], record["room"])].append(record)
+
+    violations = []
+    for (date, room), bookings in by_slot.items():
+        bookings.sort(key=lambda x: x["start_time"])
+        for i, first in enumerate(bookings):
+            for second in bookings[i + 1:]:
+                if second["start_time"] >= first["end_time"]:
+                    break
+                if overlaps(first["start_time"], first["end_time"], second["start_time"], second["end_time"]):
+                    violations.append({
+                        "date": date,
+                        "room": room,
+                        "first": [first["booking_id"], first["start_time"], first["end_time"]],
+                        "second": [second["booking_id"], second["start_time"], second["end_time"]],
+                    })
+    return violations
+
+
+# --- Reporting ---
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def build_report(records, violations, wall_time, options):
+    latencies = [latency for record in records for latency in record["rerun_latencies"]]
+    report = {
+        "sessions": options["sessions"],
+        "actions": len(records),
+        "reruns": len(latencies),
+        "wall_time": wall_time,
+        "actions_per_second": len(records) / wall_time if wall_time else 0.0,
+        "reruns_per_second": len(latencies) / wall_time if wall_time else 0.0,
+        "rerun_latency": {
+            "p50": percentile(latencies, 50),
+            "p95": percentile(latencies, 95),
+            "p99": percentile(latencies, 99),
+        },
+        "per_action": {},
+        "errors": [record["error"] for record in records if record["error"]],
+        "app_errors": [f"[{record['action']}] {message}" for record in records for message in record["app_errors"]],
+        "double_bookings": violations,
+    }
+    for action in ACTIONS:
+        action_records = [record for record in records if record["action"] == action]
+        if not action_records:
+            continue
+        action_latencies = [latency for record in action_records for latency in record["rerun_latencies"]]
+        totals = collections.Counter()
+        for record in action_records:
+            totals.update(record["calls"])
+        report["per_action"][action] = {
+            "count": len(action_records),
+            "outcomes": dict(collections.Counter(record["outcome"] for record in action_records)),
+            "rerun_latency": {
+                "p50": percentile(action_latencies, 50),
+                "p95": percentile(action_latencies, 95),
+                "p99": percentile(action_latencies, 99),
+            },
+            "sheets_calls": {name: totals["sheets." + name] / len(action_records) for name in SHEETS_CALLS},
+            "smtp_calls": {name: totals["smtp." + name] / len(action_records) for name in SMTP_CALLS},
+        }
+    return report
+
+
+def print_report(report):
+    ms = lambda seconds: f"{seconds * 1000:.0f} ms"
+    print(f"Sessions: {report['sessions']}  Actions: {report['actions']}  Reruns: {report['reruns']}")
+    print(f"Wall time: {report['wall_time']:.1f} s")
+    print(f"Throughput: {report['actions_per_second']:.2f} actions/s, {report['reruns_per_second']:.2f} reruns/s")
+    latency = report["rerun_latency"]
+    print(f"Rerun latency: p50 {ms(latency['p50'])}  p95 {ms(latency['p95'])}  p99 {ms(latency['p99'])}")
+
+    for action, stats in report["per_action"].items():
+        latency = stats["rerun_latency"]
+        outcomes = ", ".join(f"{name}={count}" for name, count in sorted(stats["outcomes"].items()))
+        print(f"\n[{action}] {stats['count']} actions ({outcomes})")
+        print(f"  Rerun latency: p50 {ms(latency['p50'])}  p95 {ms(latency['p95'])}  p99 {ms(latency['p99'])}")
+        print("  Sheets calls/action: " + ", ".join(f"{name}={value:.1f}" for name, value in stats["sheets_calls"].items()))
+        print("  SMTP calls/action: " + ", ".join(f"{name}={value:.1f}" for name, value in stats["smtp_calls"].items()))
+
+    print(f"\nDouble-booking violations: {len(report['double_bookings'])}")
+    for violation in report["double_bookings"][:10]:
+        print(f"  {violation['date']} {violation['room']}: {violation['first']} overlaps {violation['second']}")
+    if report["app_errors"]:
+        print(f"\nApp errors shown to users: {len(report['app_errors'])}")
+        for message, count in collections.Counter(report["app_errors"]).most_common(5):
+            print(f"  {count}x {message}")
+    if report["errors"]:
+        print(f"\nErrors: {len(report['errors'])}")
+        for error, count in collections.Counter(report["errors"]).most_common(5):
+            print(f"  {count}x {error}")
+
+
+# --- Main ---
+def parse_mix(value):
+    mix = dict.fromkeys(ACTIONS, 0.0)
+    for part in value.split(','):
+        name, _, weight = part.partition('=')
+        name = name.strip()
+        if name not in mix:
+            raise argparse.ArgumentTypeError(f"Unknown action in mix: {name}")
+        try:
+            mix[name] = float(weight)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"Invalid weight for {name}: {weight}")
+        if mix[name] < 0:
+            raise argparse.ArgumentTypeError(f"Weight for {name} must not be negative: {weight}")
+    if sum(mix.values()) <= 0:
+        raise argparse.ArgumentTypeError("Mix weights must add up to more than zero.")
+    return mix
+
+
+def parse_start_window(value):
+    start, _, end = value.partition('-')
+    try:
+        window = tuple(
+            datetime.datetime.strptime(part.strip(), '%H:%M').strftime('%H:%M:%S')
+            for part in (start, end)
+        )
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Start window must look like 09:00-10:00: {value}")
+    if window[0] >= window[1]:
+        raise argparse.ArgumentTypeError(f"Start window must end after it starts: {value}")
+    return window
+
+
+def positive_int(value):
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid integer: {value}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"Must be at least 1: {value}")
+    return number
+
+
+def non_negative_int(value):
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid integer: {value}")
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"Must not be negative: {value}")
+    return number
+
+
+def non_negative_float(value):
+    try:
+        number = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid number: {value}")
+    if not number >= 0:
+        raise argparse.ArgumentTypeError(f"Must not be negative: {value}")
+    return number
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Concurrent load test for meeting_room.py")
+    parser.add_argument("--sessions", type=positive_int, default=10, help="Concurrent user sessions (one process each)")
+    parser.add_argument("--actions", type=positive_int, default=10, help="Actions replayed by each session")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix(DEFAULT_MIX),
+                        help=f"Action weights (default: {DEFAULT_MIX})")
+    parser.add_argument("--start-window", type=parse_start_window, default=parse_start_window(DEFAULT_START_WINDOW),
+                        help=f"Meeting start times to book, end exclusive (default: {DEFAULT_START_WINDOW})")
+    parser.add_argument("--days", type=positive_int, default=2, help="Book into the next N days; fewer days means more contention")
+    parser.add_argument("--seed-bookings", type=non_negative_int, default=200, help="Bookings in the worksheet before the run")
+    parser.add_argument("--think-time", type=non_negative_float, default=0.5, help="Mean pause between interactions, in seconds")
+    parser.add_argument("--sheets-latency", type=non_negative_float, default=0.1, help="Simulated latency per Sheets call, in seconds")
+    parser.add_argument("--smtp-latency", type=non_negative_float, default=0.5, help="Sleep added to each patched smtplib.SMTP connection, in seconds")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Timeout for a single rerun, in seconds")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for a repeatable run")
+    parser.add_argument("--json", metavar="PATH", help="Also write the report as JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    options = {
+        "sessions": args.sessions,
+        "actions": args.actions,
+        "mix": args.mix,
+        "days": args.days,
+        "start_window": args.start_window,
+        "think_time": args.think_time,
+        "sheets_latency": args.sheets_latency,
+        "smtp_latency": args.smtp_latency,
+        "timeout": args.timeout,
+        "seed": args.seed,
+    }
+    rng = random.Random(args.seed)
+    context = multiprocessing.get_context("spawn")
+
+    try:
+        rows = seed_rows(args.seed_bookings, args.days, rng)
+    except ValueError as e:
+        raise SystemExit(f"error: {e}")
+
+    with HarnessManager(ctx=context) as manager:
+        store = manager.SheetStore(rows)
+        # The extra party is this process, so the clock starts when every session
+        # is ready. The timeout covers a session process that dies without aborting it.
+        barrier = manager.Barrier(args.sessions + 1, timeout=300)
+        records = []
+        with concurrent.futures.ProcessPoolExecutor(max_workers=args.sessions, mp_context=context) as pool:
+            futures = [pool.submit(run_session, index, store, barrier, options) for index in range(args.sessions)]
+            try:
+                barrier.wait()
+            except threading.BrokenBarrierError:
+                # A session failed before it was ready; show its error, not the barrier's.
+                concurrent.futures.wait(futures)
+                for future in futures:
+                    error = future.exception()
+                    if error is not None and not isinstance(error, threading.BrokenBarrierError):
+                        raise error from None
+                raise
+            started = time.perf_counter()
+            for future in concurrent.futures.as_completed(futures):
+                records.extend(future.result())
+            wall_time = time.perf_counter() - started
+        violations = find_double_bookings(store.rows())
+
+    report = build_report(records, violations, wall_time, options)
+    print_report(report)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
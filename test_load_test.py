@@ -0,0 +1,140 @@
+import argparse
+import random
+
+import pytest
+
+from load_test import (
+    HEADERS, find_double_bookings, parse_args, parse_mix, parse_start_window, percentile, seed_rows,
+)
+
+
+def make_row(booking_id, start_time, end_time, room="HIMALAYA - Basement", date="2026-10-20"):
+    row = dict.fromkeys(HEADERS, "")
+    row.update(booking_id=booking_id, date=date, room=room, start_time=start_time, end_time=end_time)
+    return [row[header] for header in HEADERS]
+
+
+# --- percentile ---
+def test_percentile_uses_nearest_rank():
+    values = [4, 1, 3, 2]
+    assert percentile(values, 50) == 2
+    assert percentile(values, 75) == 3
+    assert percentile(values, 99) == 4
+
+
+def test_percentile_of_hundred_values():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile(values, 99) == 99
+
+
+def test_percentile_of_single_and_no_values():
+    assert percentile([7], 1) == 7
+    assert percentile([7], 99) == 7
+    assert percentile([], 50) == 0.0
+
+
+# --- find_double_bookings ---
+def test_overlapping_slots_are_reported():
+    rows = [
+        make_row(1001, "09:00:00", "10:00:00"),
+        make_row(1002, "09:30:00", "09:45:00"),
+    ]
+    violations = find_double_bookings(rows)
+    assert len(violations) == 1
+    assert violations[0]["first"] == [1001, "09:00:00", "10:00:00"]
+    assert violations[0]["second"] == [1002, "09:30:00", "09:45:00"]
+
+
+def test_back_to_back_slots_are_not_reported():
+    rows = [
+        make_row(1001, "09:00:00", "10:00:00"),
+        make_row(1002, "10:00:00", "10:15:00"),
+        make_row(1003, "08:45:00", "09:00:00"),
+    ]
+    assert find_double_bookings(rows) == []
+
+
+def test_overlaps_in_other_rooms_or_dates_are_not_reported():
+    rows = [
+        make_row(1001, "09:00:00", "10:00:00"),
+        make_row(1002, "09:00:00", "10:00:00", room="TRISHUL - 3 Floor"),
+        make_row(1003, "09:00:00", "10:00:00", date="2026-10-21"),
+    ]
+    assert find_double_bookings(rows) == []
+
+
+def test_long_booking_overlapping_several_later_ones():
+    rows = [
+        make_row(1001, "09:00:00", "12:00:00"),
+        make_row(1002, "09:30:00", "10:00:00"),
+        make_row(1003, "11:00:00", "11:30:00"),
+    ]
+    pairs = [(v["first"][0], v["second"][0]) for v in find_double_bookings(rows)]
+    assert pairs == [(1001, 1002), (1001, 1003)]
+
+
+# --- parse_mix ---
+def test_parse_mix_fills_missing_actions_with_zero():
+    assert parse_mix("book=0.6, view=0.4") == {"book": 0.6, "cancel": 0.0, "view": 0.4}
+
+
+@pytest.mark.parametrize("value", [
+    "fly=1",
+    "book=lots",
+    "book=-1,view=2",
+    "book=0,view=0",
+])
+def test_parse_mix_rejects_bad_weights(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_mix(value)
+
+
+# --- parse_start_window ---
+def test_parse_start_window_returns_slot_strings():
+    assert parse_start_window("09:00-10:00") == ("09:00:00", "10:00:00")
+
+
+@pytest.mark.parametrize("value", ["9am-10am", "09:00", "10:00-09:00", "09:00-09:00"])
+def test_parse_start_window_rejects_bad_windows(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_start_window(value)
+
+
+# --- seed_rows ---
+def test_seed_rows_have_unique_ids_and_no_double_bookings():
+    rows = seed_rows(200, 2, random.Random(0))
+    assert len(rows) == 200
+    assert len({row[0] for row in rows}) == 200
+    assert find_double_bookings(rows) == []
+
+
+# --- parse_args ---
+@pytest.mark.parametrize("argv", [
+    ["--sessions", "0"],
+    ["--actions", "0"],
+    ["--days", "0"],
+    ["--seed-bookings", "-1"],
+    ["--think-time", "-0.5"],
+    ["--sheets-latency", "-0.1"],
+    ["--smtp-latency", "-1"],
+    ["--smtp-latency", "nan"],
+])
+def test_parse_args_rejects_out_of_range_values(argv):
+    with pytest.raises(SystemExit):
+        parse_args(argv)
+
+
+def test_parse_args_accepts_zero_where_it_means_off():
+    args = parse_args(["--days", "1", "--seed-bookings", "0", "--think-time", "0",
+                       "--sheets-latency", "0", "--smtp-latency", "0"])
+    assert args.days == 1
+    assert args.seed_bookings == 0
+    assert args.think_time == args.sheets_latency == args.smtp_latency == 0.0
+
+
+def test_seed_rows_fails_when_it_cannot_seed_every_booking():
+    # Only 9000 four-digit IDs exist, and the slots run out even sooner.
+    with pytest.raises(ValueError, match="of 9001 bookings"):
+        seed_rows(9001, 1, random.Random(0))